@@ -4,22 +4,38 @@ from .base_box_dict import BaseBoxDict
 from .base_box_list import BaseBoxList
 from .exceptions import BaseBoxForbidExtraKeyError
 from .exceptions import BaseBoxNotImplementedError
+from .exceptions import BaseBoxPathError
 from .exceptions import BaseBoxRequiredKeyError
 from .exceptions import BaseBoxRuntimeError
 from .exceptions import BaseBoxTypeError
 from .exceptions import BaseBoxValueError
 from .field import UndefinedType
+from .memory import MemoryReport
+from .memory import disable_instance_tracking
+from .memory import enable_instance_tracking
+from .memory import get_live_instance_counts
+from .path import CompiledPath
+from .path import compile_path
+from .sorted_box_list import SortedBaseBoxList
 
 __all__ = [
     "PrefixType",
     "ValueType",
     "BaseBoxDict",
     "BaseBoxList",
+    "SortedBaseBoxList",
     "BaseBoxForbidExtraKeyError",
     "BaseBoxNotImplementedError",
+    "BaseBoxPathError",
     "BaseBoxRequiredKeyError",
     "BaseBoxRuntimeError",
     "BaseBoxTypeError",
     "BaseBoxValueError",
     "UndefinedType",
+    "MemoryReport",
+    "disable_instance_tracking",
+    "enable_instance_tracking",
+    "get_live_instance_counts",
+    "CompiledPath",
+    "compile_path",
 ]
@@ -1,10 +1,99 @@
+from __future__ import annotations
+
+import weakref
+from typing import Any
 from typing import Callable
+from typing import Iterable
 from typing import NewType
+from typing import Type
+from typing import TypeVar
 from typing import Union
 
+from . import memory
+
+S = TypeVar("S", bound="BaseBox")
+
 
 class BaseBox:
-    pass
+    def __new__(cls: Type[S], *args: Any, **kwargs: Any) -> S:
+        inst = super().__new__(cls)
+        if memory.is_tracking_enabled:
+            memory.track_instance(inst)
+        return inst
+
+    # Imported in the methods: these modules import BaseBox themselves.
+    def get_path(self, path: Union[str, PrefixType]) -> Any:
+        from .path import compile_path
+
+        return compile_path(path).get(self)
+
+    def set_path(self, path: Union[str, PrefixType], value: ValueType) -> None:
+        from .path import compile_path
+
+        compile_path(path).set(self, value)
+
+    def memory_report(self) -> memory.MemoryReport:
+        return memory.get_memory_report(self)
+
+    def to_builtin(self) -> Any:
+        # Read-only: the result is the shared cache. Use to_dict/to_list for a copy.
+        from .serializer import to_builtin
+
+        return to_builtin(self)
+
+    def to_json(self) -> bytes:
+        from .serializer import to_json
+
+        return to_json(self)
+
+    def mark_dirty(self) -> None:
+        for ref in list(vars(self).get("__parents__", [])):
+            parent = ref()
+            if parent is not None:
+                parent._on_child_changed(self)
+
+        # A box registers itself on its child boxes when it caches its output,
+        # so propagation can stop at the first box without a cache.
+        stack = [self]
+        while stack:
+            inst_dict = vars(stack.pop())
+            cache = inst_dict.get("__cache__", None)
+            if not cache:
+                continue
+            cache.clear()
+            parents = inst_dict.get("__parents__", [])
+            stack.extend(parent for ref in parents if (parent := ref()) is not None)
+
+    def _on_child_changed(self, child: BaseBox) -> None:
+        pass
+
+    def _adopt(self, value: object) -> None:
+        if isinstance(value, BaseBox):
+            # Dead and duplicate links are dropped here, so the list stays bounded
+            # by the number of live boxes holding this one.
+            parents: list[weakref.ref[BaseBox]] = vars(value).setdefault("__parents__", [])
+            parents[:] = [
+                ref for ref in parents if (parent := ref()) is not None and parent is not self
+            ]
+            parents.append(weakref.ref(self))
+        elif isinstance(value, (list, tuple)):
+            self._adopt_all(value)
+        elif isinstance(value, dict):
+            self._adopt_all(value.values())
+
+    def _adopt_all(self, values: Iterable[Any]) -> None:
+        for value in values:
+            self._adopt(value)
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Weak references can't be pickled; links and caches are rebuilt on demand.
+        state = vars(self).copy()
+        state.pop("__parents__", None)
+        state.pop("__cache__", None)
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        vars(self).update(state)
 
 
 KeyType = Union[str, int]
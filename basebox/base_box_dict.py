@@ -22,6 +22,7 @@ from .exceptions import BaseBoxValueError
 from .field import Field
 from .field import Undefined
 from .field import UndefinedType
+from .serializer import copy_builtin
 from .typing_helper import get_ensured_validate_method
 from .typing_helper import get_same_type_of_validator
 from .typing_helper import resolve_annotations
@@ -128,6 +129,16 @@ class BaseBoxDict(BaseBox, metaclass=BaseBoxDictMeta):
             v = field.default
         return v
 
+    def set_child_with_prefix(self, key: str, value: ValueType, prefix: PrefixType) -> None:
+        field = self.__fields__.get(key, None)
+        if field is None:
+            raise BaseBoxForbidExtraKeyError(prefix, [key])
+        self.__data__[key] = self.validate_value_with_prefix(field, {key: value}, prefix)
+        self.mark_dirty()
+
+    def to_dict(self) -> dict[str, Any]:
+        return cast(dict[str, Any], copy_builtin(self.to_builtin()))
+
     def __getattr__(self, key: str) -> Any:
         if key in self.__data__:
             return self.__data__[key]
@@ -135,9 +146,8 @@ class BaseBoxDict(BaseBox, metaclass=BaseBoxDictMeta):
 
     def __setattr__(self, key: str, value: Any) -> None:
         # not use __fields__ or __data__ name
-        field = self.__fields__.get(key, None)
-        if field:
-            self.__data__[key] = self.validate_value_with_prefix(field, value, [])
+        if key in self.__fields__:
+            self.set_child_with_prefix(key, value, [])
         else:
             self.__dict__[key] = value
 
@@ -171,6 +181,8 @@ class BaseBoxDict(BaseBox, metaclass=BaseBoxDictMeta):
         inst.__dict__.update(self.__dict__)
         # Create a copy and avoid triggering descriptors
         inst.__dict__["__data__"] = self.__dict__["__data__"].copy()
+        inst.__dict__.pop("__cache__", None)
+        inst.__dict__.pop("__parents__", None)
         return inst
 
     def copy(self) -> BaseBoxDict:
@@ -12,12 +12,15 @@ from typing import Union
 from typing import cast
 from typing import overload
 
+from .base_box import BaseBox
 from .base_box import PrefixType
 from .base_box import ValidatedValueType
 from .base_box import ValueType
+from .exceptions import BaseBoxPathError
 from .exceptions import BaseBoxTypeError
 from .exceptions import BaseBoxValueError
 from .field import UndefinedType
+from .serializer import copy_builtin
 from .typing_helper import get_ensured_validate_method
 from .typing_helper import get_generic_types
 
@@ -32,11 +35,13 @@ class BaseBoxListMeta(type):
         if _is_BaseBoxList_defined and name != BaseBoxList.__name__:
             generic_types = get_generic_types(BaseBoxList, namespace, 1)
 
-            get_ensured_validate_method(
-                var_name="item",
-                namespace=namespace,
-                return_type=cast(Type[ValidatedValueType], generic_types[0]),
-            )
+            # A still generic subclass (e.g. SortedBaseBoxList[T]) has no validator yet.
+            if not isinstance(generic_types[0], TypeVar):
+                get_ensured_validate_method(
+                    var_name="item",
+                    namespace=namespace,
+                    return_type=cast(Type[ValidatedValueType], generic_types[0]),
+                )
             namespace["__generic_type__"] = generic_types[0]
 
         new_cls = super().__new__(cls, name, bases, namespace)
@@ -47,7 +52,7 @@ class CombinedMeta(ABCMeta, BaseBoxListMeta):
     pass
 
 
-class BaseBoxList(MutableSequence[T], metaclass=CombinedMeta):
+class BaseBoxList(MutableSequence[T], BaseBox, metaclass=CombinedMeta):
     if TYPE_CHECKING:
         __generic_type__: Type[Any]
 
@@ -88,6 +93,27 @@ class BaseBoxList(MutableSequence[T], metaclass=CombinedMeta):
         finally:
             prefix.pop()
 
+    def normalize_index_with_prefix(self, index: int, prefix: PrefixType) -> int:
+        if isinstance(index, bool) or not isinstance(index, int):
+            raise BaseBoxTypeError(prefix + [index], index, "Must be an int index.", [int])
+        if not -len(self) <= index < len(self):
+            raise BaseBoxPathError(prefix + [index], "Index out of range.")
+        return index % len(self)
+
+    def set_child_with_prefix(self, index: int, value: ValueType, prefix: PrefixType) -> None:
+        index = self.normalize_index_with_prefix(index, prefix)
+        self.__data__[index] = self.validate_item_with_prefix(index, value, prefix)
+        self.mark_dirty()
+
+    def set_all_with_prefix(self, value: ValueType, prefix: PrefixType) -> None:
+        self.__data__[:] = [
+            self.validate_item_with_prefix(i, value, prefix) for i in range(len(self))
+        ]
+        self.mark_dirty()
+
+    def to_list(self) -> list[Any]:
+        return cast(list[Any], copy_builtin(self.to_builtin()))
+
     def __lt__(self, other: Union[list[T], BaseBoxList[T]]) -> bool:
         # TypeError
         return self.__data__ < self.__cast(other)
@@ -149,14 +175,18 @@ class BaseBoxList(MutableSequence[T], metaclass=CombinedMeta):
         # TypeError
         # IndexError
         if isinstance(index, int):
-            self.__data__[index] = self.validate_item_with_prefix(index, item, [])
+            if not -len(self) <= index < len(self):
+                raise IndexError("list assignment index out of range")
+            self.set_child_with_prefix(index, item, [])
         else:
             self.__data__[index] = self.validate_all(item, [])
+            self.mark_dirty()
 
     def __delitem__(self, idx: Union[int, slice]) -> None:
         # TypeError
         # IndexError
         del self.__data__[idx]
+        self.mark_dirty()
 
     def __add__(self, other: Iterable[T]) -> BaseBoxList[T]:
         new_list = self.copy()
@@ -170,6 +200,7 @@ class BaseBoxList(MutableSequence[T], metaclass=CombinedMeta):
 
     def __iadd__(self, other: Iterable[T]) -> BaseBoxList[T]:
         self.__data__ += self.validate_all(other, [])
+        self.mark_dirty()
         return self
 
     def __mul__(self, n: int) -> BaseBoxList[T]:
@@ -183,6 +214,7 @@ class BaseBoxList(MutableSequence[T], metaclass=CombinedMeta):
     def __imul__(self, n: int) -> BaseBoxList[T]:
         # TypeError int
         self.__data__ *= n
+        self.mark_dirty()
         return self
 
     def __copy__(self) -> BaseBoxList[T]:
@@ -190,26 +222,34 @@ class BaseBoxList(MutableSequence[T], metaclass=CombinedMeta):
         inst.__dict__.update(self.__dict__)
         # Create a copy and avoid triggering descriptors
         inst.__dict__["__data__"] = self.__dict__["__data__"][:]
+        inst.__dict__.pop("__cache__", None)
+        inst.__dict__.pop("__parents__", None)
         return inst
 
     def append(self, value: T) -> None:
         validated_value = self.validate_item_with_prefix(len(self), value, [])
         self.__data__.append(validated_value)
+        self.mark_dirty()
 
     def insert(self, index: int, value: T) -> None:
         validated_value = self.validate_item_with_prefix(index, value, [])
         self.__data__.insert(index, validated_value)
+        self.mark_dirty()
 
     def pop(self, index: int = -1) -> T:
         # TypeError int
-        return self.__data__.pop(index)
+        value = self.__data__.pop(index)
+        self.mark_dirty()
+        return value
 
     def remove(self, value: T) -> None:
         # ValueError item
         self.__data__.remove(value)
+        self.mark_dirty()
 
     def clear(self) -> None:
         self.__data__.clear()
+        self.mark_dirty()
 
     def copy(self) -> BaseBoxList[T]:
         new_list = self.__class__()
@@ -225,13 +265,16 @@ class BaseBoxList(MutableSequence[T], metaclass=CombinedMeta):
 
     def reverse(self) -> None:
         self.__data__.reverse()
+        self.mark_dirty()
 
     def sort(self, *args: Any, **kwargs: Any) -> None:
         self.__data__.sort(*args, **kwargs)
+        self.mark_dirty()
 
     def extend(self, values: Iterable[T]) -> None:
         validated_values = self.validate_all(values, [])
         self.__data__.extend(validated_values)
+        self.mark_dirty()
 
 
 _is_BaseBoxList_defined = True
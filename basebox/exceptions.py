@@ -71,3 +71,12 @@ class BaseBoxForbidExtraKeyError(KeyError, PrefixMixin):
 
     def __str__(self) -> str:
         return f"Forbid extra {self.extra_keys} keys\n  Prefix: {self.prefix}"
+
+
+class BaseBoxPathError(KeyError, PrefixMixin):
+    def __init__(self, prefix: PrefixType, msg: str):
+        self.prefix = prefix.copy()
+        self.msg = msg
+
+    def __str__(self) -> str:
+        return f"{self.msg}\n  Prefix: {self.prefix}"
@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import sys
+import weakref
+from types import BuiltinFunctionType
+from types import FunctionType
+from types import MethodType
+from types import ModuleType
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Type
+
+if TYPE_CHECKING:
+    from .base_box import BaseBox
+
+_CACHE_KEYS = ("__cache__", "__parents__")
+is_tracking_enabled = False
+_live_instances: dict[Type[Any], dict[int, _InstanceRef]] = {}
+
+
+class _InstanceRef(weakref.ref[Any]):
+    __slots__ = ("cls",)
+    cls: Type[Any]
+
+    def __new__(cls, inst: object) -> _InstanceRef:
+        ref = super().__new__(cls, inst, _forget_instance)
+        ref.cls = type(inst)
+        return ref
+
+
+def _forget_instance(ref: _InstanceRef) -> None:
+    refs = _live_instances.get(ref.cls, None)
+    if refs is not None:
+        refs.pop(id(ref), None)
+
+
+def enable_instance_tracking() -> None:
+    global is_tracking_enabled
+    is_tracking_enabled = True
+
+
+def disable_instance_tracking() -> None:
+    global is_tracking_enabled
+    is_tracking_enabled = False
+    _live_instances.clear()
+
+
+def track_instance(inst: object) -> None:
+    # Boxes define __eq__ without __hash__, so they can't go into a WeakSet.
+    ref = _InstanceRef(inst)
+    _live_instances.setdefault(ref.cls, {})[id(ref)] = ref
+
+
+def get_live_instance_counts() -> dict[Type[Any], int]:
+    counts = {cls: len(refs) for cls, refs in list(_live_instances.items())}
+    return {cls: cnt for cls, cnt in counts.items() if cnt}
+
+
+class MemoryReport:
+    def __init__(self) -> None:
+        self.total = 0
+        self.cache = 0
+        self.by_field: dict[str, int] = {}
+        self.by_class: dict[Type[Any], int] = {}
+        self._seen: set[int] = set()
+        self._caches: list[object] = []
+
+    def __repr__(self) -> str:
+        args = {
+            "total": self.total,
+            "cache": self.cache,
+            "by_field": self.by_field,
+            "by_class": {cls.__qualname__: size for cls, size in self.by_class.items()},
+        }
+        return f"<MemoryReport: {repr(args)}>"
+
+    def _add(self, obj: object, shallow: bool = False) -> int:
+        # base_box imports this module for the instance tracking in __new__.
+        from .base_box import BaseBox
+
+        size = 0
+        stack = [obj]
+        while stack:
+            o = stack.pop()
+            if id(o) in self._seen:
+                continue
+            self._seen.add(id(o))
+
+            s = sys.getsizeof(o)
+            cls = type(o)
+            self.by_class[cls] = self.by_class.get(cls, 0) + s
+            size += s
+            if shallow:
+                continue
+
+            if isinstance(o, BaseBox):
+                # Serializer caches and parent links are reported on their own.
+                inst_dict = vars(o)
+                size += self._add(inst_dict, shallow=True)
+                stack.extend(inst_dict)
+                for key, value in inst_dict.items():
+                    if key in _CACHE_KEYS:
+                        self._caches.append(value)
+                    else:
+                        stack.append(value)
+            else:
+                stack.extend(_get_referents(o))
+        return size
+
+
+def _get_referents(obj: object) -> list[Any]:
+    if isinstance(obj, (str, bytes, int, float, bool, type(None))):
+        return []
+    if isinstance(obj, (type, ModuleType, FunctionType, BuiltinFunctionType, MethodType)):
+        return []
+    if isinstance(obj, dict):
+        return [*obj.keys(), *obj.values()]
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        return list(obj)
+    try:
+        return [vars(obj)]
+    except TypeError:
+        return []
+
+
+def get_memory_report(box: BaseBox) -> MemoryReport:
+    report = MemoryReport()
+    inst_dict: dict[str, Any] = vars(box)
+    data: Any = inst_dict["__data__"]
+
+    # The box shell: the instance, its __dict__ and the __data__ container.
+    for obj in (box, inst_dict, data):
+        report.total += report._add(obj, shallow=True)
+    for key, value in inst_dict.items():
+        report.total += report._add(key)
+        if key in _CACHE_KEYS:
+            report._caches.append(value)
+        elif key != "__data__":
+            report.total += report._add(value)
+
+    if isinstance(data, dict):
+        for name, value in data.items():
+            report.total += report._add(name)
+            size = report._add(value)
+            report.by_field[name] = size
+            report.total += size
+    else:
+        for i, value in enumerate(data):
+            size = report._add(value)
+            report.by_field[f"[{i}]"] = size
+            report.total += size
+
+    while report._caches:
+        report.cache += report._add(report._caches.pop())
+
+    report._seen.clear()
+    return report
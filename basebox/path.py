@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+from typing import Any
+from typing import Iterator
+from typing import Union
+
+from .base_box import KeyType
+from .base_box import PrefixMixin
+from .base_box import PrefixType
+from .base_box import ValueType
+from .exceptions import BaseBoxPathError
+
+WILDCARD = "*"
+
+_NAME = r"[A-Za-z_]\w*"
+_INDEX = r"\[(?:-?\d+|\*)\]"
+_PATH_PATTERN = re.compile(rf"(?:(?:{_NAME}|{_INDEX})(?:\.{_NAME}|{_INDEX})*)?")
+_TOKEN_PATTERN = re.compile(rf"({_NAME})|\[(-?\d+|\*)\]")
+
+
+class CompiledPath(PrefixMixin):
+    def __init__(self, keys: tuple[KeyType, ...]):
+        self.keys = keys
+        self.prefix = list(keys)
+        self.has_wildcard = WILDCARD in keys
+
+    def __repr__(self) -> str:
+        return f"<CompiledPath: {repr(self.generate_key_string())}>"
+
+    def get(self, root: object) -> Any:
+        if not self.has_wildcard:
+            node = root
+            for depth, key in enumerate(self.keys):
+                node = self._get_child(node, key, depth)
+            return node
+
+        nodes = [root]
+        for depth, key in enumerate(self.keys):
+            if key == WILDCARD:
+                nodes = [child for node in nodes for child in self._get_children(node, depth)]
+            else:
+                nodes = [self._get_child(node, key, depth) for node in nodes]
+        return nodes
+
+    def set(self, root: object, value: ValueType) -> None:
+        if not self.keys:
+            raise BaseBoxPathError([], "Cannot set the root of a path.")
+
+        *parent_keys, last_key = self.keys
+        for parent, prefix in self._resolve_with_prefix(root, parent_keys):
+            if last_key == WILDCARD:
+                self._get_children(parent, len(parent_keys))
+                setter = getattr(type(parent), "set_all_with_prefix", None)
+                args: tuple[Any, ...] = (value, prefix)
+            else:
+                setter = getattr(type(parent), "set_child_with_prefix", None)
+                args = (last_key, value, prefix)
+
+            if setter is None:
+                raise BaseBoxPathError(prefix, "Cannot set a value into a non-box object.")
+            setter(parent, *args)
+
+    def _resolve_with_prefix(
+        self, root: object, keys: list[KeyType]
+    ) -> Iterator[tuple[object, PrefixType]]:
+        nodes: list[tuple[object, PrefixType]] = [(root, [])]
+        for depth, key in enumerate(keys):
+            if key == WILDCARD:
+                nodes = [
+                    (child, prefix + [i])
+                    for node, prefix in nodes
+                    for i, child in enumerate(self._get_children(node, depth))
+                ]
+            else:
+                nodes = [
+                    (self._get_child(node, key, depth), prefix + [key]) for node, prefix in nodes
+                ]
+        return iter(nodes)
+
+    def _get_child(self, node: object, key: KeyType, depth: int) -> Any:
+        data = getattr(node, "__data__", node)
+        if isinstance(data, (dict, list)):
+            try:
+                return data[key]  # type: ignore[index]
+            except (LookupError, TypeError):
+                pass
+        raise BaseBoxPathError(self.prefix[: depth + 1], "Not found the path.")
+
+    def _get_children(self, node: object, depth: int) -> list[Any]:
+        data = getattr(node, "__data__", node)
+        if not isinstance(data, list):
+            raise BaseBoxPathError(self.prefix[: depth + 1], "Wildcard requires a list.")
+        return data
+
+
+def compile_path(path: Union[str, PrefixType]) -> CompiledPath:
+    if isinstance(path, str):
+        return _compile_string(path)
+
+    # Check before the cached call: lru_cache can't hash keys like [1].
+    for key in path:
+        if isinstance(key, bool) or not isinstance(key, (str, int)):
+            raise BaseBoxPathError(list(path), f"Invalid path key: {repr(key)}")
+    return _compile_keys(tuple(path))
+
+
+@lru_cache(maxsize=1024)
+def _compile_string(path: str) -> CompiledPath:
+    if _PATH_PATTERN.fullmatch(path) is None:
+        raise BaseBoxPathError([], f"Invalid path syntax: {repr(path)}")
+
+    keys: list[KeyType] = []
+    for name, index in _TOKEN_PATTERN.findall(path):
+        if name:
+            keys.append(name)
+        elif index == WILDCARD:
+            keys.append(WILDCARD)
+        else:
+            keys.append(int(index))
+    return CompiledPath(tuple(keys))
+
+
+@lru_cache(maxsize=1024)
+def _compile_keys(keys: tuple[KeyType, ...]) -> CompiledPath:
+    return CompiledPath(keys)
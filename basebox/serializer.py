@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import json
+from typing import Any
+from typing import Optional
+from typing import Union
+
+from .base_box import BaseBox
+
+JsonPartsType = Union[bytes, list[Union[bytes, BaseBox]]]
+
+
+def _get_cache(box: BaseBox) -> dict[str, Any]:
+    cache: dict[str, Any] = vars(box).setdefault("__cache__", {})
+    return cache
+
+
+def _dumps(value: object) -> bytes:
+    return json.dumps(value, separators=(",", ":"), default=to_builtin).encode()
+
+
+def to_builtin(value: object) -> Any:
+    # The cached result is shared between calls, so callers must not mutate it.
+    if isinstance(value, dict):
+        return {key: to_builtin(v) for key, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [to_builtin(v) for v in value]
+    if not isinstance(value, BaseBox):
+        return value
+
+    cache = _get_cache(value)
+    result = cache.get("builtin", None)
+    if result is None:
+        data = vars(value)["__data__"]
+        result = to_builtin(data)
+        # Parent links are only needed once a cache depends on the children.
+        value._adopt(data)
+        cache["builtin"] = result
+    return result
+
+
+def copy_builtin(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {key: copy_builtin(v) for key, v in value.items()}
+    if isinstance(value, list):
+        return [copy_builtin(v) for v in value]
+    return value
+
+
+def _get_json_parts(box: BaseBox) -> JsonPartsType:
+    cache = _get_cache(box)
+    parts: Optional[JsonPartsType] = cache.get("json_parts", None)
+    if parts is not None:
+        return parts
+
+    data = vars(box)["__data__"]
+    box._adopt(data)
+    values = data.values() if isinstance(data, dict) else data
+    if not any(isinstance(v, BaseBox) for v in values):
+        # Boxes nested in plain containers are handled by to_builtin.
+        parts = _dumps(data)
+    else:
+        # Child boxes are kept by reference, so each level doesn't hold
+        # another copy of the serialized subtree.
+        parts = []
+        if isinstance(data, dict):
+            items = ((_dumps(key) + b":", v) for key, v in data.items())
+            opening, closing = b"{", b"}"
+        else:
+            items = ((b"", v) for v in data)
+            opening, closing = b"[", b"]"
+
+        buf = [opening]
+        for i, (key, v) in enumerate(items):
+            if i:
+                buf.append(b",")
+            buf.append(key)
+            if isinstance(v, BaseBox):
+                parts.append(b"".join(buf))
+                parts.append(v)
+                buf.clear()
+            else:
+                buf.append(_dumps(v))
+        buf.append(closing)
+        parts.append(b"".join(buf))
+
+    cache["json_parts"] = parts
+    return parts
+
+
+def _write_json(box: BaseBox, out: list[bytes]) -> None:
+    parts = _get_json_parts(box)
+    if isinstance(parts, bytes):
+        out.append(parts)
+        return
+    for part in parts:
+        if isinstance(part, bytes):
+            out.append(part)
+        else:
+            _write_json(part, out)
+
+
+def to_json(value: object) -> bytes:
+    if not isinstance(value, BaseBox):
+        return _dumps(value)
+
+    cache = _get_cache(value)
+    result: Optional[bytes] = cache.get("json", None)
+    if result is None:
+        out: list[bytes] = []
+        _write_json(value, out)
+        result = b"".join(out)
+        cache["json"] = result
+    return result
@@ -0,0 +1,265 @@
+from __future__ import annotations
+
+from bisect import bisect_left
+from bisect import bisect_right
+from heapq import merge
+from inspect import getattr_static
+from operator import itemgetter
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Callable
+from typing import Iterable
+from typing import Iterator
+from typing import Optional
+from typing import TypeVar
+from typing import Union
+from typing import cast
+from typing import overload
+
+from .base_box import BaseBox
+from .base_box import PrefixType
+from .base_box import ValueType
+from .base_box_list import BaseBoxList
+from .exceptions import BaseBoxNotImplementedError
+
+T = TypeVar("T")
+
+
+def _get_field_key(name: str) -> Callable[[Any], Any]:
+    def key(item: Any) -> Any:
+        return item.__data__[name]
+
+    return key
+
+
+class SortedBaseBoxList(BaseBoxList[T]):
+    # An in-place change is re-sorted when it is made on the element itself, e.g.
+    # a key field. Call resort() after changing nested values that a callable key reads.
+    if TYPE_CHECKING:
+        __sort_key__: Union[str, Callable[[T], Any]]
+        __key_func__: Callable[[T], Any]
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        if isinstance(cls.__generic_type__, TypeVar):
+            return
+
+        sort_key = getattr_static(cls, "__sort_key__", None)
+        if isinstance(sort_key, staticmethod):
+            sort_key = sort_key.__func__
+        if isinstance(sort_key, str):
+            fields = getattr(cls.__generic_type__, "__fields__", {})
+            if sort_key not in fields:
+                f = """Sort key isn't a field of the item type.
+  Got Field: {0}
+  Item Type: {1}"""
+                raise BaseBoxNotImplementedError(f.format(sort_key, cls.__generic_type__))
+            sort_key = _get_field_key(sort_key)
+        if not callable(sort_key):
+            f = """Sort key isn't defined correctly.
+  Expected: __sort_key__ = <field name> or <callable(item)>"""
+            raise BaseBoxNotImplementedError(f)
+        cls.__key_func__ = staticmethod(sort_key)
+
+    def __init__(
+        self,
+        value: Iterable[Any] = [],
+        prefix: PrefixType = [],
+    ):
+        super().__init__(value, prefix)
+        self.__keys__: list[Any] = [self.__key_func__(item) for item in self.__data__]
+        self._sort_by_keys()
+        self._adopt(self.__data__)
+
+    def _sort_by_keys(self) -> None:
+        keys = self.__keys__
+        order = sorted(range(len(keys)), key=keys.__getitem__)
+        self.__keys__ = [keys[i] for i in order]
+        self.__data__[:] = [self.__data__[i] for i in order]
+
+    def _insert_sorted(self, value: T) -> None:
+        key = self.__key_func__(value)
+        i = bisect_right(self.__keys__, key)
+        self.__keys__.insert(i, key)
+        self.__data__.insert(i, value)
+        self._adopt(value)
+        self.mark_dirty()
+
+    def _merge_sorted(self, values: list[T]) -> None:
+        batch = sorted(((self.__key_func__(value), value) for value in values), key=itemgetter(0))
+        if not batch:
+            return
+
+        # Only the tail after the smallest new key has to be merged.
+        start = bisect_right(self.__keys__, batch[0][0])
+        if start == len(self.__keys__):
+            merged: Iterable[tuple[Any, T]] = batch
+        else:
+            tail = zip(self.__keys__[start:], self.__data__[start:])
+            merged = list(merge(tail, batch, key=itemgetter(0)))
+        self.__keys__[start:] = [key for key, _ in merged]
+        self.__data__[start:] = [value for _, value in merged]
+        self._adopt_all(values)
+        self.mark_dirty()
+
+    def set_child_with_prefix(self, index: int, value: ValueType, prefix: PrefixType) -> None:
+        index = self.normalize_index_with_prefix(index, prefix)
+        validated_value = self.validate_item_with_prefix(index, value, prefix)
+        del self[index]
+        self._insert_sorted(validated_value)
+
+    def set_all_with_prefix(self, value: ValueType, prefix: PrefixType) -> None:
+        super().set_all_with_prefix(value, prefix)
+        self._adopt(self.__data__)
+        self.resort()
+
+    def _on_child_changed(self, child: BaseBox) -> None:
+        # Re-place an element whose key field was changed in place.
+        key = self.__key_func__(cast(T, child))
+        keys, data = self.__keys__, self.__data__
+        lo, hi = bisect_left(keys, key), bisect_right(keys, key)
+        if any(data[i] is child for i in range(lo, hi)):
+            return
+
+        indexes = [i for i, value in enumerate(data) if value is child]
+        if not indexes:
+            return
+        for i in reversed(indexes):
+            del keys[i]
+            del data[i]
+        for _ in indexes:
+            i = bisect_right(keys, key)
+            keys.insert(i, key)
+            data.insert(i, cast(T, child))
+        self.mark_dirty()
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        super().__setstate__(state)
+        self._adopt(self.__data__)
+
+    @overload
+    def __getitem__(self, index: int) -> T:
+        pass
+
+    @overload
+    def __getitem__(self, index: slice) -> SortedBaseBoxList[T]:
+        pass
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[T, SortedBaseBoxList[T]]:
+        if isinstance(index, int):
+            return self.__data__[index]
+        new_list = self.__class__()
+        new_list.__data__ = self.__data__[index]
+        new_list.__keys__ = self.__keys__[index]
+        if (index.step or 1) < 0:
+            new_list._sort_by_keys()
+        new_list._adopt(new_list.__data__)
+        return new_list
+
+    def __setitem__(self, index: Union[int, slice], item: Union[T, Iterable[T]]) -> None:
+        super().__setitem__(index, item)
+        if isinstance(index, slice):
+            self._adopt(self.__data__)
+            self.resort()
+
+    def __delitem__(self, idx: Union[int, slice]) -> None:
+        super().__delitem__(idx)
+        del self.__keys__[idx]
+
+    def __add__(self, other: Iterable[T]) -> SortedBaseBoxList[T]:
+        new_list = self.copy()
+        new_list.extend(other)
+        return new_list
+
+    def __radd__(self, other: Iterable[T]) -> SortedBaseBoxList[T]:
+        new_list = self.__class__(other)
+        new_list._merge_sorted(self.__data__)
+        return new_list
+
+    def __iadd__(self, other: Iterable[T]) -> SortedBaseBoxList[T]:
+        self.extend(other)
+        return self
+
+    def __mul__(self, n: int) -> SortedBaseBoxList[T]:
+        new_list = self.copy()
+        new_list *= n
+        return new_list
+
+    __rmul__ = __mul__
+
+    def __imul__(self, n: int) -> SortedBaseBoxList[T]:
+        super().__imul__(n)
+        self.__keys__ *= n
+        self._sort_by_keys()
+        return self
+
+    def __copy__(self) -> SortedBaseBoxList[T]:
+        inst = cast(SortedBaseBoxList[T], super().__copy__())
+        inst.__dict__["__keys__"] = self.__keys__[:]
+        inst._adopt(inst.__data__)
+        return inst
+
+    def append(self, value: T) -> None:
+        self._insert_sorted(self.validate_item_with_prefix(len(self), value, []))
+
+    def insert(self, index: int, value: T) -> None:
+        # The position is decided by the sort key; index is only used for errors.
+        self._insert_sorted(self.validate_item_with_prefix(index, value, []))
+
+    def pop(self, index: int = -1) -> T:
+        value = super().pop(index)
+        del self.__keys__[index]
+        return value
+
+    def remove(self, value: T) -> None:
+        # ValueError item
+        del self[self.index(value)]
+
+    def clear(self) -> None:
+        super().clear()
+        self.__keys__.clear()
+
+    def copy(self) -> SortedBaseBoxList[T]:
+        new_list = self.__class__()
+        new_list.__data__ = self.__data__.copy()
+        new_list.__keys__ = self.__keys__.copy()
+        new_list._adopt(new_list.__data__)
+        return new_list
+
+    def resort(self) -> None:
+        self.__keys__ = [self.__key_func__(item) for item in self.__data__]
+        self._sort_by_keys()
+        self.mark_dirty()
+
+    def reverse(self) -> None:
+        raise BaseBoxNotImplementedError("SortedBaseBoxList can't be reversed.")
+
+    def sort(self, *args: Any, **kwargs: Any) -> None:
+        # Always sorted by __sort_key__.
+        if args or kwargs:
+            raise BaseBoxNotImplementedError("SortedBaseBoxList is sorted by __sort_key__.")
+
+    def extend(self, values: Iterable[T]) -> None:
+        self._merge_sorted(self.validate_all(values, []))
+
+    def bisect_left(self, key: Any) -> int:
+        return bisect_left(self.__keys__, key)
+
+    def bisect_right(self, key: Any) -> int:
+        return bisect_right(self.__keys__, key)
+
+    bisect = bisect_right
+
+    def irange(
+        self,
+        lo: Optional[Any] = None,
+        hi: Optional[Any] = None,
+        inclusive: tuple[bool, bool] = (True, True),
+    ) -> Iterator[T]:
+        start = 0
+        if lo is not None:
+            start = self.bisect_left(lo) if inclusive[0] else self.bisect_right(lo)
+        stop = len(self)
+        if hi is not None:
+            stop = self.bisect_right(hi) if inclusive[1] else self.bisect_left(hi)
+        return iter(self.__data__[start:stop])
@@ -75,11 +75,12 @@ def get_generic_types(
     target_cls: Type[object], namespace: dict[str, Any], cnt: int
 ) -> tuple[Type[Any], ...]:
     generics: Iterable[GenericAlias] = namespace.get("__orig_bases__", [])
-    generic = {get_origin(t): t for t in generics}.get(target_cls, None)
-    if generic is not None:
-        generic_types = get_args(generic)
-        if len(generic_types) == cnt:
-            return generic_types
+    for generic in generics:
+        origin = get_origin(generic)
+        if isinstance(origin, type) and issubclass(origin, target_cls):
+            generic_types = get_args(generic)
+            if len(generic_types) == cnt:
+                return generic_types
     raise BaseBoxNotImplementedError("Not correctly define generic.")
 
 
@@ -0,0 +1,104 @@
+import gc
+import sys
+from typing import Iterator
+
+import pytest
+
+from basebox import BaseBoxDict
+from basebox import BaseBoxList
+from basebox import PrefixType
+from basebox import ValueType
+from basebox import disable_instance_tracking
+from basebox import enable_instance_tracking
+from basebox import get_live_instance_counts
+
+
+class Record(BaseBoxDict):
+    name: str
+    payload: object = None
+
+    def validate_name(self, value: ValueType, prefix: PrefixType) -> str:
+        return str(value)
+
+    def validate_payload(self, value: ValueType, prefix: PrefixType) -> object:
+        return value
+
+
+class Records(BaseBoxList[Record]):
+    def validate_item(self, value: ValueType, prefix: PrefixType) -> Record:
+        return Record(value, prefix)
+
+
+class Holder(BaseBoxDict):
+    a: object
+    b: object
+
+    def validate_a(self, value: ValueType, prefix: PrefixType) -> object:
+        return value
+
+    def validate_b(self, value: ValueType, prefix: PrefixType) -> object:
+        return value
+
+
+@pytest.fixture
+def tracking() -> Iterator[None]:
+    enable_instance_tracking()
+    yield
+    disable_instance_tracking()
+
+
+def test_memory_report_by_field() -> None:
+    payload = "x" * 1000
+    report = Record({"name": "a", "payload": payload}).memory_report()
+    assert report.by_field["payload"] == sys.getsizeof(payload)
+    assert report.total > sum(report.by_field.values())
+    assert report.by_class[str] >= sys.getsizeof(payload)
+    assert report.cache == 0
+
+
+def test_memory_report_counts_shared_objects_once() -> None:
+    shared = ["y" * 100 for _ in range(100)]
+    report = Holder({"a": shared, "b": shared}).memory_report()
+    assert report.by_field["a"] > 0
+    assert report.by_field["b"] == 0
+
+    distinct = Holder({"a": shared, "b": list(shared)}).memory_report()
+    # Only the outer list of "b" is new; its strings are shared with "a".
+    assert distinct.by_field["b"] == sys.getsizeof(list(shared))
+
+
+def test_memory_report_list() -> None:
+    records = Records([{"name": "a"}, {"name": "b"}])
+    report = records.memory_report()
+    assert list(report.by_field) == ["[0]", "[1]"]
+    assert report.by_class[Record] == 2 * sys.getsizeof(records[0])
+
+
+def test_memory_report_keeps_cache_out_of_fields() -> None:
+    records = Records([{"name": str(i), "payload": "z" * 100} for i in range(50)])
+    before = records.memory_report()
+    dict_size = sys.getsizeof(vars(records[1]))
+    records.to_json()
+    after = records.memory_report()
+    assert after.cache > len(records.to_json())
+    # Outside of the cache bucket only the instance __dict__ grew for the new keys.
+    grown = sys.getsizeof(vars(records[1])) - dict_size
+    assert after.by_field["[1]"] - before.by_field["[1]"] == grown
+
+
+def test_live_instance_counts_are_opt_in() -> None:
+    records = Records([{"name": "a"}])
+    assert Record not in get_live_instance_counts()
+    del records
+
+
+def test_live_instance_counts(tracking: None) -> None:
+    records = Records([{"name": "a"}, {"name": "b"}])
+    copied = records.copy()
+    counts = get_live_instance_counts()
+    assert counts[Record] == 2
+    assert counts[Records] == 2
+
+    del records, copied
+    gc.collect()
+    assert Record not in get_live_instance_counts()
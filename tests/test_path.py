@@ -0,0 +1,149 @@
+import pytest
+
+from basebox import BaseBoxDict
+from basebox import BaseBoxForbidExtraKeyError
+from basebox import BaseBoxList
+from basebox import BaseBoxPathError
+from basebox import BaseBoxTypeError
+from basebox import PrefixType
+from basebox import ValueType
+from basebox import compile_path
+
+
+class Product(BaseBoxDict):
+    sku: str
+
+    def validate_sku(self, value: ValueType, prefix: PrefixType) -> str:
+        if not isinstance(value, str):
+            raise BaseBoxTypeError(prefix, value, "Must be a str type.", [str])
+        return value
+
+
+class Products(BaseBoxList[Product]):
+    def validate_item(self, value: ValueType, prefix: PrefixType) -> Product:
+        return Product(value, prefix)
+
+
+class Order(BaseBoxDict):
+    products: Products
+
+    def validate_products(self, value: ValueType, prefix: PrefixType) -> Products:
+        return Products(value, prefix)
+
+
+class Orders(BaseBoxList[Order]):
+    def validate_item(self, value: ValueType, prefix: PrefixType) -> Order:
+        return Order(value, prefix)
+
+
+class Root(BaseBoxDict):
+    orders: Orders
+
+    def validate_orders(self, value: ValueType, prefix: PrefixType) -> Orders:
+        return Orders(value, prefix)
+
+
+def make_root() -> Root:
+    orders = [{"products": [{"sku": f"s{i}{j}"} for j in range(2)]} for i in range(3)]
+    return Root({"orders": orders})
+
+
+def test_get_path() -> None:
+    root = make_root()
+    assert root.get_path("orders[2].products[1].sku") == "s21"
+    assert root.get_path(["orders", 2, "products", 1, "sku"]) == "s21"
+    assert root.get_path("orders[-1].products[0]") is root.orders[2].products[0]
+    assert root.get_path("") is root
+
+
+def test_get_path_wildcard() -> None:
+    root = make_root()
+    assert root.get_path("orders[*].products[0].sku") == ["s00", "s10", "s20"]
+    assert root.get_path("orders[*].products[*].sku") == ["s00", "s01", "s10", "s11", "s20", "s21"]
+    assert root.orders.get_path("[*].products[1].sku") == ["s01", "s11", "s21"]
+
+
+def test_set_path() -> None:
+    root = make_root()
+    root.set_path("orders[1].products[0].sku", "X")
+    assert root.orders[1].products[0].sku == "X"
+
+    root.set_path(["orders", 0, "products", 1], {"sku": "Y"})
+    assert isinstance(root.orders[0].products[1], Product)
+    assert root.orders[0].products[1].sku == "Y"
+
+
+def test_set_path_wildcard() -> None:
+    root = make_root()
+    root.set_path("orders[*].products[1].sku", "Z")
+    assert root.get_path("orders[*].products[*].sku") == ["s00", "Z", "s10", "Z", "s20", "Z"]
+
+    products = root.orders[0].products
+    originals = list(products)
+    products.set_path("[*]", {"sku": "W"})
+    assert [p.sku for p in products] == ["W", "W"]
+    assert all(p is not o for p, o in zip(products, originals))
+
+
+def test_set_path_error_prefix() -> None:
+    root = make_root()
+    with pytest.raises(BaseBoxTypeError) as e:
+        root.set_path("orders[1].products[0].sku", 1)
+    assert e.value.prefix == ["orders", 1, "products", 0, "sku"]
+    assert root.orders[1].products[0].sku == "s10"
+
+    with pytest.raises(BaseBoxTypeError) as e:
+        root.set_path("orders[*].products[*].sku", 1)
+    assert e.value.prefix == ["orders", 0, "products", 0, "sku"]
+
+    with pytest.raises(BaseBoxForbidExtraKeyError) as e:
+        root.set_path("orders[0].nope", 1)
+    assert e.value.prefix == ["orders", 0]
+
+
+def test_path_not_found() -> None:
+    root = make_root()
+    with pytest.raises(BaseBoxPathError) as e:
+        root.get_path("orders[9].products")
+    assert e.value.prefix == ["orders", 9]
+
+    with pytest.raises(BaseBoxPathError) as e:
+        root.get_path("orders[0].products[0].sku[*]")
+    assert e.value.prefix == ["orders", 0, "products", 0, "sku", "*"]
+
+
+def test_set_path_index_out_of_range() -> None:
+    root = make_root()
+    with pytest.raises(BaseBoxPathError) as e:
+        root.set_path("orders[99]", {"products": []})
+    assert e.value.prefix == ["orders", 99]
+
+    with pytest.raises(BaseBoxPathError) as e:
+        root.set_path("orders[0].products[-3]", {"sku": "X"})
+    assert e.value.prefix == ["orders", 0, "products", -3]
+
+    with pytest.raises(BaseBoxTypeError) as e:
+        root.set_path("orders[-1].products[-1]", {"sku": 1})
+    assert e.value.prefix == ["orders", -1, "products", 1, "sku"]
+
+    with pytest.raises(IndexError):
+        root.orders[3] = {"products": []}
+    assert len(root.orders) == 3
+
+
+@pytest.mark.parametrize("path", ["orders..sku", ".orders", "orders[", "orders[x]", "0"])
+def test_invalid_path_syntax(path: str) -> None:
+    with pytest.raises(BaseBoxPathError):
+        compile_path(path)
+
+
+@pytest.mark.parametrize("path", [["orders", [1]], ["orders", True], ["orders", 1.0]])
+def test_invalid_path_keys(path: PrefixType) -> None:
+    with pytest.raises(BaseBoxPathError):
+        compile_path(path)
+
+
+def test_compile_path_is_cached() -> None:
+    assert compile_path("orders[0].sku") is compile_path("orders[0].sku")
+    assert compile_path(["orders", 0]) is compile_path(["orders", 0])
+    assert compile_path("orders[3].products[*]").keys == ("orders", 3, "products", "*")
@@ -0,0 +1,199 @@
+import copy
+import json
+import pickle
+from typing import Any
+from typing import Callable
+
+import pytest
+
+from basebox import BaseBoxDict
+from basebox import BaseBoxList
+from basebox import BaseBoxTypeError
+from basebox import PrefixType
+from basebox import ValueType
+
+
+class Item(BaseBoxDict):
+    sku: str
+
+    def validate_sku(self, value: ValueType, prefix: PrefixType) -> str:
+        if not isinstance(value, str):
+            raise BaseBoxTypeError(prefix, value, "Must be a str type.", [str])
+        return value
+
+
+class Items(BaseBoxList[Item]):
+    def validate_item(self, value: ValueType, prefix: PrefixType) -> Item:
+        return Item(value, prefix)
+
+
+class Config(BaseBoxDict):
+    name: str
+    records: Items
+    extra: object = None
+
+    def validate_name(self, value: ValueType, prefix: PrefixType) -> str:
+        return str(value)
+
+    def validate_records(self, value: ValueType, prefix: PrefixType) -> Items:
+        return Items(value, prefix)
+
+    def validate_extra(self, value: ValueType, prefix: PrefixType) -> object:
+        return value
+
+
+def dumps(value: Any) -> bytes:
+    return json.dumps(value, separators=(",", ":")).encode()
+
+
+def make_plain() -> dict[str, Any]:
+    return {"name": "cfg", "records": [{"sku": s} for s in "abc"], "extra": None}
+
+
+def sku(item: Any) -> str:
+    return str(dict(item.items())["sku"])
+
+
+LIST_MUTATIONS: list[Callable[[Any], Any]] = [
+    lambda lst: lst.append({"sku": "z"}),
+    lambda lst: lst.insert(1, {"sku": "z"}),
+    lambda lst: lst.extend([{"sku": "y"}, {"sku": "z"}]),
+    lambda lst: lst.__iadd__([{"sku": "z"}]),
+    lambda lst: lst.__imul__(2),
+    lambda lst: lst.__setitem__(0, {"sku": "z"}),
+    lambda lst: lst.__setitem__(slice(0, 2), [{"sku": "z"}]),
+    lambda lst: lst.__delitem__(0),
+    lambda lst: lst.__delitem__(slice(1, None)),
+    lambda lst: lst.pop(),
+    lambda lst: lst.pop(0),
+    lambda lst: lst.remove({"sku": "b"}),
+    lambda lst: lst.clear(),
+    lambda lst: lst.reverse(),
+    lambda lst: lst.sort(key=sku, reverse=True),
+]
+
+
+@pytest.mark.parametrize("mutate", LIST_MUTATIONS)
+def test_list_mutators_invalidate_cache(mutate: Callable[[Any], Any]) -> None:
+    plain = make_plain()
+    config = Config(make_plain())
+    assert config.to_json() == dumps(plain)
+
+    mutate(plain["records"])
+    mutate(config.records)
+    assert config.to_json() == dumps(plain)
+    assert config.records.to_json() == dumps(plain["records"])
+    assert config.to_dict() == plain
+
+
+def test_field_change_invalidates_cache() -> None:
+    plain = make_plain()
+    config = Config(make_plain())
+    config.to_json()
+
+    config.records[1].sku = "X"
+    plain["records"][1]["sku"] = "X"
+    assert config.to_json() == dumps(plain)
+
+    config.name = "renamed"
+    plain["name"] = "renamed"
+    assert config.to_json() == dumps(plain)
+
+    config.set_path("records[2].sku", "Y")
+    plain["records"][2]["sku"] = "Y"
+    assert config.to_json() == dumps(plain)
+
+
+def test_unchanged_output_is_reused() -> None:
+    config = Config(make_plain())
+    first = config.records[0].to_json()
+    whole = config.to_json()
+    assert config.to_json() is whole
+
+    config.records[1].sku = "X"
+    assert config.records[0].to_json() is first
+    assert config.to_json() is not whole
+
+
+def test_shared_child_invalidates_every_parent() -> None:
+    config = Config(make_plain())
+    copied = copy.copy(config.records)
+    config.to_json()
+    copied.to_json()
+
+    config.records[0].sku = "X"
+    assert json.loads(config.to_json())["records"][0]["sku"] == "X"
+    assert json.loads(copied.to_json())[0]["sku"] == "X"
+
+
+def test_boxes_in_plain_containers() -> None:
+    item = Item({"sku": "a"})
+    config = Config({"name": "cfg", "records": [], "extra": {"items": [item], "n": (1, 2)}})
+    assert config.to_dict()["extra"] == {"items": [{"sku": "a"}], "n": [1, 2]}
+    assert json.loads(config.to_json())["extra"]["items"] == [{"sku": "a"}]
+
+    item.sku = "CHANGED"
+    assert json.loads(config.to_json())["extra"]["items"] == [{"sku": "CHANGED"}]
+    assert config.to_dict()["extra"]["items"] == [{"sku": "CHANGED"}]
+
+
+def test_to_builtin_is_shared() -> None:
+    config = Config(make_plain())
+    builtin = config.to_builtin()
+    assert builtin == make_plain()
+    assert config.to_builtin() is builtin
+    assert config.to_builtin()["records"] is config.records.to_builtin()
+
+    config.name = "renamed"
+    assert config.to_builtin() is not builtin
+    assert config.to_builtin()["records"] is builtin["records"]
+
+
+def test_to_dict_returns_a_copy() -> None:
+    config = Config(make_plain())
+    d = config.to_dict()
+    d["records"].clear()
+    d["name"] = "other"
+    assert config.to_dict() == make_plain()
+
+    lst = config.records.to_list()
+    lst[0]["sku"] = "other"
+    assert config.records.to_list() == make_plain()["records"]
+
+
+def test_mark_dirty_after_in_place_change() -> None:
+    config = Config({"name": "cfg", "records": [], "extra": [1]})
+    config.to_json()
+    config.extra.append(2)
+    config.mark_dirty()
+    assert json.loads(config.to_json())["extra"] == [1, 2]
+
+
+def test_parent_links_are_lazy_and_bounded() -> None:
+    config = Config(make_plain())
+    item = config.records[0]
+    assert "__parents__" not in vars(item)
+
+    config.to_json()
+    assert len(vars(item)["__parents__"]) == 1
+    for _ in range(100):
+        config.records[0:2].to_json()
+        config.records.copy().to_json()
+        (config.records * 2).to_json()
+        config.to_json()
+    assert len(vars(item)["__parents__"]) <= 3
+
+    item.sku = "X"
+    assert json.loads(config.to_json())["records"][0]["sku"] == "X"
+
+
+def test_pickle_round_trip() -> None:
+    config = Config(make_plain())
+    config.to_json()
+    restored = pickle.loads(pickle.dumps(config))
+    assert restored == config
+    assert restored.to_json() == config.to_json()
+
+    restored.records[0].sku = "X"
+    assert json.loads(restored.to_json())["records"][0]["sku"] == "X"
+    assert json.loads(config.to_json())["records"][0]["sku"] == "a"
@@ -0,0 +1,256 @@
+import copy
+import json
+import pickle
+from typing import Any
+from typing import Callable
+
+import pytest
+
+from basebox import BaseBoxDict
+from basebox import BaseBoxNotImplementedError
+from basebox import BaseBoxPathError
+from basebox import BaseBoxTypeError
+from basebox import PrefixType
+from basebox import SortedBaseBoxList
+from basebox import ValueType
+
+
+class Event(BaseBoxDict):
+    ts: int
+    name: str = ""
+
+    def validate_ts(self, value: ValueType, prefix: PrefixType) -> int:
+        if not isinstance(value, int):
+            raise BaseBoxTypeError(prefix, value, "Must be an int type.", [int])
+        return value
+
+    def validate_name(self, value: ValueType, prefix: PrefixType) -> str:
+        return str(value)
+
+
+class Events(SortedBaseBoxList[Event]):
+    __sort_key__ = "ts"
+
+    def validate_item(self, value: ValueType, prefix: PrefixType) -> Event:
+        return Event(value, prefix)
+
+
+class Descending(SortedBaseBoxList[int]):
+    __sort_key__ = staticmethod(lambda v: -v)
+
+    def validate_item(self, value: ValueType, prefix: PrefixType) -> int:
+        return int(str(value))
+
+
+class Wrapper(BaseBoxDict):
+    ev: Event
+
+    def validate_ev(self, value: ValueType, prefix: PrefixType) -> Event:
+        return Event(value, prefix)
+
+
+class Wrapped(SortedBaseBoxList[Wrapper]):
+    __sort_key__ = staticmethod(lambda w: w.ev.ts)
+
+    def validate_item(self, value: ValueType, prefix: PrefixType) -> Wrapper:
+        return Wrapper(value, prefix)
+
+
+def assert_sorted(lst: SortedBaseBoxList[Any]) -> None:
+    keys = lst.__keys__
+    assert keys == [lst.__key_func__(item) for item in lst.__data__]
+    assert keys == sorted(keys)
+
+
+def ts(lst: Events) -> list[int]:
+    return [e.ts for e in lst]
+
+
+def make_events() -> Events:
+    return Events([{"ts": 5, "name": "e"}, {"ts": 1}, {"ts": 3}, {"ts": 3, "name": "t"}])
+
+
+MUTATIONS: list[Callable[[Events], Any]] = [
+    lambda e: e.append({"ts": 2}),
+    lambda e: e.append({"ts": 9}),
+    lambda e: e.insert(0, {"ts": 4}),
+    lambda e: e.extend([{"ts": 7}, {"ts": 0}, {"ts": 3}]),
+    lambda e: e.extend([{"ts": 8}, {"ts": 6}]),
+    lambda e: e.__iadd__([{"ts": 2}]),
+    lambda e: e.__imul__(2),
+    lambda e: e.__setitem__(0, {"ts": 10}),
+    lambda e: e.__setitem__(slice(1, 3), [{"ts": 0}, {"ts": 12}, {"ts": 4}]),
+    lambda e: e.__delitem__(1),
+    lambda e: e.__delitem__(slice(0, 2)),
+    lambda e: e.pop(),
+    lambda e: e.pop(1),
+    lambda e: e.remove({"ts": 3, "name": "t"}),
+    lambda e: e.clear(),
+    lambda e: e.sort(),
+    lambda e: e.set_path("[*]", {"ts": 2}),
+    lambda e: e.set_path("[0].ts", 10),
+    lambda e: e.set_path("[*].ts", 4),
+    lambda e: setattr(e[-1], "ts", -1),
+    lambda e: setattr(e[1], "name", "renamed"),
+]
+
+
+@pytest.mark.parametrize("mutate", MUTATIONS)
+def test_mutations_keep_sorted(mutate: Callable[[Events], Any]) -> None:
+    events = make_events()
+    events.to_json()
+    mutate(events)
+    assert_sorted(events)
+    assert json.loads(events.to_json()) == events.to_list()
+    assert [e["ts"] for e in events.to_list()] == ts(events)
+
+
+def test_init_and_stable_ties() -> None:
+    events = make_events()
+    assert_sorted(events)
+    assert [(e.ts, e.name) for e in events] == [(1, ""), (3, ""), (3, "t"), (5, "e")]
+
+    events.append({"ts": 3, "name": "later"})
+    events.extend([{"ts": 3, "name": "batch"}])
+    assert [e.name for e in events if e.ts == 3] == ["", "t", "later", "batch"]
+
+
+def test_new_lists_stay_sorted() -> None:
+    events = make_events()
+    derived = [
+        events[1:3],
+        events[::-1],
+        events.copy(),
+        copy.copy(events),
+        events + [{"ts": 2}],
+        [{"ts": 4}] + events,
+        events * 2,
+    ]
+    for lst in derived:
+        assert isinstance(lst, Events)
+        assert_sorted(lst)
+    assert ts(events[::-1]) == ts(events)
+    assert ts([{"ts": 4}] + events) == [1, 3, 3, 4, 5]
+
+
+def test_copy_has_own_keys() -> None:
+    events = make_events()
+    copied = copy.copy(events)
+    copied.append({"ts": 0})
+    assert_sorted(events)
+    assert len(events.__keys__) == 4
+
+
+def test_wildcard_set_replaces_every_element() -> None:
+    events = Events([{"ts": 1}, {"ts": 2}, {"ts": 3}])
+    originals = list(events)
+    events.set_path("[*]", {"ts": 2})
+    assert ts(events) == [2, 2, 2]
+    assert not any(e is o for e in events for o in originals)
+
+
+def test_in_place_key_change_is_replaced() -> None:
+    events = make_events()
+    first = events[0]
+    first.ts = 10
+    assert events[-1] is first
+    assert ts(events) == [3, 3, 5, 10]
+    assert [e.ts for e in events.irange(4, 10)] == [5, 10]
+    assert events.bisect(3) == 2
+
+    removed = events.pop()
+    removed.ts = 0
+    assert ts(events) == [3, 3, 5]
+
+
+def test_nested_key_change_and_resort() -> None:
+    wrapped = Wrapped([{"ev": {"ts": t}} for t in [3, 1, 2]])
+    wrapped.to_json()
+    first = wrapped[0]
+    first.ev.ts = 9
+    wrapped.resort()
+    assert wrapped[-1] is first
+    assert [w.ev.ts for w in wrapped] == [2, 3, 9]
+    assert_sorted(wrapped)
+    assert [w["ev"]["ts"] for w in json.loads(wrapped.to_json())] == [2, 3, 9]
+
+    # Replacing the whole key field is seen without resort().
+    wrapped[0].ev = {"ts": 10}
+    assert [w.ev.ts for w in wrapped] == [3, 9, 10]
+    assert_sorted(wrapped)
+
+
+def test_set_path_index_out_of_range() -> None:
+    events = make_events()
+    with pytest.raises(BaseBoxPathError) as e:
+        events.set_path("[4]", {"ts": 0})
+    assert e.value.prefix == [4]
+    with pytest.raises(BaseBoxTypeError) as e:
+        events.set_path("[-1]", {"ts": "x"})
+    assert e.value.prefix == [3, "ts"]
+    assert ts(events) == [1, 3, 3, 5]
+
+
+def test_pickle_round_trip() -> None:
+    events = make_events()
+    restored = pickle.loads(pickle.dumps(events))
+    assert restored == events
+    assert_sorted(restored)
+
+    restored[0].ts = 10
+    assert ts(restored) == [3, 3, 5, 10]
+    assert ts(events) == [1, 3, 3, 5]
+
+
+def test_bisect_and_irange() -> None:
+    events = Events([{"ts": t} for t in [1, 3, 3, 5, 7, 9]])
+    assert events.bisect_left(3) == 1
+    assert events.bisect_right(3) == 3
+    assert events.bisect(3) == 3
+    assert [e.ts for e in events.irange(3, 7)] == [3, 3, 5, 7]
+    assert [e.ts for e in events.irange(3, 7, (False, False))] == [5]
+    assert [e.ts for e in events.irange(hi=3)] == [1, 3, 3]
+    assert [e.ts for e in events.irange(lo=8)] == [9]
+
+
+def test_callable_key() -> None:
+    values = Descending([3, 1, 2])
+    values.extend([5, 0])
+    values.append(4)
+    assert list(values) == [5, 4, 3, 2, 1, 0]
+    assert_sorted(values)
+
+
+def test_unsupported_operations() -> None:
+    events = make_events()
+    with pytest.raises(BaseBoxNotImplementedError):
+        events.reverse()
+    with pytest.raises(BaseBoxNotImplementedError):
+        events.sort(key=len)
+    with pytest.raises(BaseBoxTypeError):
+        events.append({"ts": "x"})
+    assert_sorted(events)
+
+
+def test_bad_sort_key() -> None:
+    with pytest.raises(BaseBoxNotImplementedError):
+
+        class Missing(SortedBaseBoxList[int]):
+            def validate_item(self, value: ValueType, prefix: PrefixType) -> int:
+                return 1
+
+    with pytest.raises(BaseBoxNotImplementedError):
+
+        class UnknownField(SortedBaseBoxList[Event]):
+            __sort_key__ = "nope"
+
+            def validate_item(self, value: ValueType, prefix: PrefixType) -> Event:
+                return Event(value, prefix)
+
+    with pytest.raises(BaseBoxNotImplementedError):
+
+        class NotABox(SortedBaseBoxList[int]):
+            __sort_key__ = "ts"
+
+            def validate_item(self, value: ValueType, prefix: PrefixType) -> int:
+                return 1